@@ -1,8 +1,12 @@
 """Application entry point for trading models web app."""
 from __future__ import annotations
 
+from datetime import timedelta
 from pathlib import Path
+from typing import Any
+
 from flask import Flask, render_template
+from flask.json.provider import DefaultJSONProvider
 
 from .config import AppConfig
 from .models.day_trading.routes import day_trading_bp
@@ -12,6 +16,16 @@ config = AppConfig()
 config.ensure_directories()
 
 
+class JSONProvider(DefaultJSONProvider):
+    """Serialise config values (e.g. ``refresh_interval``) the way ``save_json`` does."""
+
+    @staticmethod
+    def default(o: Any) -> Any:
+        if isinstance(o, (timedelta, Path)):
+            return str(o)
+        return DefaultJSONProvider.default(o)
+
+
 def create_app() -> Flask:
     """Create and configure the Flask application."""
     app = Flask(
@@ -30,6 +44,7 @@ def create_app() -> Flask:
             }
         ])
 
+    app.json = JSONProvider(app)
     app.config["APP_CONFIG"] = config
 
     # Register model specific blueprints
@@ -4,11 +4,15 @@ from __future__ import annotations
 import argparse
 import json
 from dataclasses import asdict
+from pathlib import Path
 
 from .config import AppConfig
+from .loadtest import DEFAULT_ROUTES, LoadTestConfig, format_report, run_load_test
+from .models.day_trading.calibration import CALIBRATION_METHODS, THRESHOLD_METRICS
 from .models.day_trading.config import DayTradingConfig
 from .models.day_trading.pipeline import DayTradingPipeline
 from .models.day_trading.realtime import DayTradingStreamer
+from .utils import save_json
 
 
 def _day_trading_config_from_args(args: argparse.Namespace) -> DayTradingConfig:
@@ -20,6 +24,19 @@ def _day_trading_config_from_args(args: argparse.Namespace) -> DayTradingConfig:
     return DayTradingConfig(**kwargs) if kwargs else DayTradingConfig()
 
 
+def _route_weight(value: str) -> tuple[str, float]:
+    route, _, weight = value.partition("=")
+    try:
+        parsed = float(weight) if weight else 1.0
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Expected ROUTE or ROUTE=WEIGHT, got '{value}'") from None
+    if not route.startswith("/"):
+        raise argparse.ArgumentTypeError(f"Route must start with '/', got '{route}'")
+    if not parsed > 0:
+        raise argparse.ArgumentTypeError(f"Route weight must be positive, got '{weight}'")
+    return route, parsed
+
+
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="Utilities for training and monitoring trading models")
     subparsers = parser.add_subparsers(dest="command", required=True)
@@ -29,6 +46,8 @@ def build_parser() -> argparse.ArgumentParser:
     train_parser.add_argument("--symbol", dest="symbol")
     train_parser.add_argument("--lookback-days", dest="lookback_days", type=int)
     train_parser.add_argument("--epochs", dest="epochs", type=int)
+    train_parser.add_argument("--calibration-method", dest="calibration_method", choices=CALIBRATION_METHODS)
+    train_parser.add_argument("--threshold-metric", dest="threshold_metric", choices=THRESHOLD_METRICS)
     train_parser.add_argument("--force-download", dest="force_download", action="store_true")
 
     status_parser = subparsers.add_parser("status", help="Show model metrics")
@@ -37,6 +56,28 @@ def build_parser() -> argparse.ArgumentParser:
     stream_parser = subparsers.add_parser("stream", help="Show latest stream points")
     stream_parser.add_argument("model", choices=["day_trading"], help="Model identifier")
 
+    runs_parser = subparsers.add_parser("runs", help="List or compare past training runs")
+    runs_parser.add_argument("model", choices=["day_trading"], help="Model identifier")
+    runs_parser.add_argument("--limit", type=int, default=20)
+    runs_parser.add_argument("--offset", type=int, default=0)
+    runs_parser.add_argument("--compare", nargs="+", type=int, metavar="RUN_ID", help="Compare metrics of these runs")
+
+    load_parser = subparsers.add_parser("loadtest", help="Load-test the web app under gunicorn with replayed data")
+    load_parser.add_argument("--workers", nargs="+", type=int, default=[1, 2], help="gunicorn worker counts to try")
+    load_parser.add_argument("--threads", nargs="+", type=int, default=[1, 4], help="gunicorn thread counts to try")
+    load_parser.add_argument("--clients", type=int, default=16, help="Concurrent clients")
+    load_parser.add_argument("--duration", type=float, default=30.0, help="Seconds to drive each configuration")
+    load_parser.add_argument(
+        "--route",
+        dest="routes",
+        action="append",
+        type=_route_weight,
+        metavar="ROUTE[=WEIGHT]",
+        help=f"Route mix entry; repeat to build the mix (default: {', '.join(f'{r}={w:g}' for r, w in DEFAULT_ROUTES.items())})",
+    )
+    load_parser.add_argument("--output", type=Path, help="Write the full results as JSON to this path")
+    load_parser.add_argument("--log-dir", type=Path, help="Directory for gunicorn logs (default: a new temp directory)")
+
     return parser
 
 
@@ -67,6 +108,27 @@ def main(argv: list[str] | None = None) -> None:
             return
         for point in streamer.to_stream_points():
             print(json.dumps(asdict(point), default=str))
+    elif args.command == "loadtest":
+        load_cfg = LoadTestConfig(
+            workers=tuple(args.workers),
+            threads=tuple(args.threads),
+            clients=args.clients,
+            duration=args.duration,
+            log_dir=args.log_dir,
+        )
+        if args.routes:
+            load_cfg.routes = dict(args.routes)
+        results = run_load_test(load_cfg)
+        print(format_report(results))
+        if args.output:
+            save_json(args.output, [asdict(result) for result in results])
+    elif args.command == "runs":
+        pipeline = DayTradingPipeline(app_cfg)
+        if args.compare:
+            print(json.dumps(pipeline.store.compare_runs(args.compare), indent=2, default=str))
+            return
+        for run in pipeline.store.list_runs(pipeline.model_name, limit=args.limit, offset=args.offset):
+            print(json.dumps(run, default=str))
 
 
 if __name__ == "__main__":
@@ -16,11 +16,19 @@ class AppConfig:
     broker_api_key: str | None = os.getenv("BROKER_API_KEY")
     broker_api_secret: str | None = os.getenv("BROKER_API_SECRET" )
     broker_base_url: str | None = os.getenv("BROKER_BASE_URL", "https://paper-api.alpaca.markets")
+    run_store_path: str | None = os.getenv("TRADING_RUN_DB")
+    data_source: str = os.getenv("TRADING_DATA_SOURCE", "yahoo")
 
     def ensure_directories(self) -> None:
         self.data_dir.mkdir(parents=True, exist_ok=True)
         self.artifacts_dir.mkdir(parents=True, exist_ok=True)
 
+    @property
+    def run_store(self) -> Path:
+        if self.run_store_path:
+            return Path(self.run_store_path)
+        return self.artifacts_dir / "runs.sqlite3"
+
     @property
     def day_trading_storage(self) -> Path:
         path = self.artifacts_dir / "day_trading"
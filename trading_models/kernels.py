@@ -0,0 +1,269 @@
+"""Vectorised rolling-window kernels shared by the feature pipelines.
+
+Every kernel works along the last axis of a 1D ``(time,)`` or 2D
+``(symbols, time)`` array and returns an array of the same shape. Positions
+without a full window are ``NaN`` (matching pandas' ``rolling(window)``
+defaults) and any window that touches a ``NaN`` yields ``NaN``, so ragged
+universes can be right-padded with ``NaN`` and processed in one call.
+"""
+from __future__ import annotations
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Iterable
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+from scipy.signal import lfilter
+
+
+def _as_2d(values) -> tuple[np.ndarray, bool]:
+    arr = np.asarray(values, dtype=float)
+    if arr.ndim not in (1, 2):
+        raise ValueError(f"Expected a 1D or 2D array, got {arr.ndim} dimensions")
+    return np.atleast_2d(arr), arr.ndim == 1
+
+
+def _restore(arr: np.ndarray, squeeze: bool) -> np.ndarray:
+    return arr[0] if squeeze else arr
+
+
+def _first_valid(arr: np.ndarray, valid: np.ndarray) -> np.ndarray:
+    idx = valid.argmax(axis=1)
+    first = arr[np.arange(arr.shape[0]), idx]
+    return np.where(valid.any(axis=1), first, 0.0)
+
+
+def _check_window(window: int) -> int:
+    window = int(window)
+    if window < 1:
+        raise ValueError(f"window must be a positive integer, got {window}")
+    return window
+
+
+def rolling_window(values, window: int) -> np.ndarray:
+    """Return a read-only strided view of shape ``(..., n - window + 1, window)``."""
+    arr = np.asarray(values)
+    window = _check_window(window)
+    if arr.shape[-1] < window:
+        return np.empty((*arr.shape[:-1], 0, window), dtype=arr.dtype)
+    return sliding_window_view(arr, window, axis=-1)
+
+
+@dataclass
+class _CumulativeSums:
+    """Prefix sums of a 2D array that answer any window size by differencing.
+
+    Values are centred on each row's first valid observation before summing.
+    Only means are derived from the sums: their rounding error is relative to
+    the window mean, so drifting price levels stay accurate. Variances would
+    cancel catastrophically here, so :func:`rolling_std` uses a windowed
+    two-pass instead.
+    """
+
+    offset: np.ndarray
+    sums: np.ndarray
+    missing: np.ndarray
+
+    @classmethod
+    def build(cls, arr: np.ndarray) -> "_CumulativeSums":
+        valid = np.isfinite(arr)
+        offset = _first_valid(arr, valid)
+        centred = np.where(valid, arr - offset[:, None], 0.0)
+        pad = np.zeros((arr.shape[0], 1))
+        return cls(
+            offset=offset,
+            sums=np.concatenate([pad, np.cumsum(centred, axis=1)], axis=1),
+            missing=np.concatenate([pad, np.cumsum(~valid, axis=1)], axis=1),
+        )
+
+    @staticmethod
+    def _window_diff(prefix: np.ndarray, window: int) -> np.ndarray:
+        out = np.full((prefix.shape[0], prefix.shape[1] - 1), np.nan)
+        if window < prefix.shape[1]:
+            out[:, window - 1 :] = prefix[:, window:] - prefix[:, :-window]
+        return out
+
+    def _incomplete(self, window: int) -> np.ndarray:
+        missing = self._window_diff(self.missing, window)
+        return ~(missing == 0)
+
+    def mean(self, window: int) -> np.ndarray:
+        window = _check_window(window)
+        out = self._window_diff(self.sums, window) / window + self.offset[:, None]
+        out[self._incomplete(window)] = np.nan
+        return out
+
+
+# Upper bound on the elements materialised per chunk by the windowed two-pass.
+_STD_CHUNK_ELEMENTS = 1 << 22
+
+
+def _windowed_std(arr: np.ndarray, window: int, ddof: int = 1) -> np.ndarray:
+    window = _check_window(window)
+    n_rows, n_cols = arr.shape
+    out = np.full((n_rows, n_cols), np.nan)
+    if window <= ddof or window > n_cols:
+        return out
+    windows = sliding_window_view(arr, window, axis=1)
+    step = max(1, _STD_CHUNK_ELEMENTS // (n_rows * window))
+    for start in range(0, windows.shape[1], step):
+        chunk = windows[:, start : start + step]
+        out[:, window - 1 + start : window - 1 + start + chunk.shape[1]] = chunk.std(axis=2, ddof=ddof)
+    return out
+
+
+def rolling_mean(values, window: int) -> np.ndarray:
+    """Simple moving average computed from prefix sums in ``O(n)``."""
+    arr, squeeze = _as_2d(values)
+    return _restore(_CumulativeSums.build(arr).mean(window), squeeze)
+
+
+def rolling_std(values, window: int, ddof: int = 1) -> np.ndarray:
+    """Rolling standard deviation using an exact two-pass over each window.
+
+    Costs ``O(n * window)`` but, unlike a sum-of-squares formula, stays
+    accurate on non-stationary inputs such as drifting price levels. Windows
+    are evaluated in bounded chunks to cap memory.
+    """
+    arr, squeeze = _as_2d(values)
+    return _restore(_windowed_std(arr, window, ddof=ddof), squeeze)
+
+
+def diff(values, periods: int = 1) -> np.ndarray:
+    arr, squeeze = _as_2d(values)
+    periods = _check_window(periods)
+    out = np.full_like(arr, np.nan)
+    out[:, periods:] = arr[:, periods:] - arr[:, :-periods]
+    return _restore(out, squeeze)
+
+
+def pct_change(values, periods: int = 1) -> np.ndarray:
+    arr, squeeze = _as_2d(values)
+    periods = _check_window(periods)
+    out = np.full_like(arr, np.nan)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        out[:, periods:] = arr[:, periods:] / arr[:, :-periods] - 1.0
+    return _restore(out, squeeze)
+
+
+def ewm_mean(values, *, span: float | None = None, alpha: float | None = None) -> np.ndarray:
+    """Exponentially weighted mean matching pandas ``ewm(adjust=False)``.
+
+    Leading ``NaN`` stay ``NaN`` and each row starts from its first valid
+    observation. Gap-free rows run as a first-order IIR filter over all rows
+    at once. If any row has interior gaps, the recursion steps through time
+    instead, vectorised across rows. It then follows pandas' ``ignore_na=False``
+    weighting: the value is held through a gap and the previous mean is
+    decayed by ``(1 - alpha) ** (gap + 1)`` when the next observation arrives.
+    """
+    if (span is None) == (alpha is None):
+        raise ValueError("Pass exactly one of span or alpha")
+    if alpha is None:
+        alpha = 2.0 / (float(span) + 1.0)
+    if not 0.0 < alpha <= 1.0:
+        raise ValueError(f"alpha must be in (0, 1], got {alpha}")
+    arr, squeeze = _as_2d(values)
+    if arr.shape[1] == 0:
+        return _restore(arr.copy(), squeeze)
+    valid = np.isfinite(arr)
+    started = np.logical_or.accumulate(valid, axis=1)
+    if (started & ~valid).any():
+        return _restore(_ewm_mean_with_gaps(arr, valid, alpha), squeeze)
+    seed = _first_valid(arr, valid)
+    filled = np.where(started, arr, seed[:, None])
+    out, _ = lfilter([alpha], [1.0, alpha - 1.0], filled, axis=1, zi=((1.0 - alpha) * seed)[:, None])
+    out[~started] = np.nan
+    return _restore(out, squeeze)
+
+
+def _ewm_mean_with_gaps(arr: np.ndarray, valid: np.ndarray, alpha: float) -> np.ndarray:
+    out = np.empty_like(arr)
+    mean = np.where(valid[:, 0], arr[:, 0], np.nan)
+    old_weight = np.ones(arr.shape[0])
+    out[:, 0] = mean
+    for t in range(1, arr.shape[1]):
+        has_mean = ~np.isnan(mean)
+        old_weight = np.where(has_mean, old_weight * (1.0 - alpha), old_weight)
+        update = has_mean & valid[:, t]
+        with np.errstate(invalid="ignore"):
+            blended = (old_weight * mean + alpha * arr[:, t]) / (old_weight + alpha)
+        mean = np.where(update, blended, np.where(~has_mean & valid[:, t], arr[:, t], mean))
+        old_weight = np.where(update, 1.0, old_weight)
+        out[:, t] = mean
+    return out
+
+
+def rsi(close, window: int) -> np.ndarray:
+    """Wilder relative strength index using ``alpha = 1 / window`` smoothing."""
+    delta = diff(close)
+    avg_gain = ewm_mean(np.maximum(delta, 0.0), alpha=1.0 / window)
+    avg_loss = ewm_mean(-np.minimum(delta, 0.0), alpha=1.0 / window)
+    rs = avg_gain / (avg_loss + 1e-9)
+    return 100 - (100 / (1 + rs))
+
+
+def _window_features_block(
+    close: np.ndarray,
+    volume: np.ndarray,
+    windows: tuple[int, ...],
+    rsi_window: int,
+) -> dict[str, np.ndarray]:
+    returns = pct_change(close)
+    close_sums = _CumulativeSums.build(close)
+    volume_sums = _CumulativeSums.build(volume)
+
+    with np.errstate(invalid="ignore"):
+        columns: dict[str, np.ndarray] = {
+            "return": returns,
+            "log_return": np.log1p(returns),
+            "price_change": diff(close),
+        }
+    for window in windows:
+        columns[f"sma_{window}"] = close_sums.mean(window)
+        columns[f"ema_{window}"] = ewm_mean(close, span=window)
+        columns[f"momentum_{window}"] = pct_change(close, window)
+        columns[f"volatility_{window}"] = _windowed_std(returns, window)
+        columns[f"volume_sma_{window}"] = volume_sums.mean(window)
+    columns["rsi"] = rsi(close, rsi_window)
+    return columns
+
+
+def compute_window_features(
+    close,
+    volume,
+    windows: Iterable[int],
+    rsi_window: int,
+    n_jobs: int | None = None,
+) -> dict[str, np.ndarray]:
+    """Compute price/volume indicators for every window in a few fused passes.
+
+    ``close`` and ``volume`` are ``(time,)`` or ``(symbols, time)`` arrays.
+    Prefix sums are built once per input and reused for every window. With
+    more than one symbol the rows are split into ``n_jobs`` chunks (default:
+    one per CPU) that run on a thread pool, since NumPy and SciPy release the
+    GIL inside their kernels. Returns a mapping of feature name to array in
+    the column order used by the day trading model.
+    """
+    close_arr, squeeze = _as_2d(close)
+    volume_arr, _ = _as_2d(volume)
+    if close_arr.shape != volume_arr.shape:
+        raise ValueError(f"close and volume shapes differ: {close_arr.shape} vs {volume_arr.shape}")
+    windows = tuple(_check_window(w) for w in windows)
+
+    n_rows = close_arr.shape[0]
+    n_jobs = min(n_jobs or os.cpu_count() or 1, n_rows)
+    if n_jobs <= 1:
+        columns = _window_features_block(close_arr, volume_arr, windows, rsi_window)
+    else:
+        chunks = np.array_split(np.arange(n_rows), n_jobs)
+        with ThreadPoolExecutor(max_workers=n_jobs) as pool:
+            blocks = list(
+                pool.map(
+                    lambda rows: _window_features_block(close_arr[rows], volume_arr[rows], windows, rsi_window),
+                    chunks,
+                )
+            )
+        columns = {key: np.concatenate([block[key] for block in blocks], axis=0) for key in blocks[0]}
+    return {key: _restore(value, squeeze) for key, value in columns.items()}
@@ -0,0 +1,337 @@
+"""Load-test harness that drives a gunicorn-served app with concurrent clients."""
+from __future__ import annotations
+
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import numpy as np
+import requests
+
+from .config import AppConfig
+from .models.day_trading.pipeline import DayTradingPipeline
+
+
+DEFAULT_ROUTES = {
+    "/": 1.0,
+    "/day_trading/": 1.0,
+    "/day_trading/status": 2.0,
+    "/day_trading/stream": 6.0,
+    "/day_trading/train": 0.2,
+}
+POST_ROUTES = {"/day_trading/train"}
+
+
+@dataclass
+class LoadTestConfig:
+    workers: tuple[int, ...] = (1, 2)
+    threads: tuple[int, ...] = (1, 4)
+    clients: int = 16
+    duration: float = 30.0
+    routes: dict[str, float] = field(default_factory=lambda: dict(DEFAULT_ROUTES))
+    train_epochs: int = 1
+    request_timeout: float = 120.0
+    startup_timeout: float = 60.0
+    sample_interval: float = 0.5
+    seed: int = 42
+    log_dir: Path | None = None
+
+
+@dataclass
+class RouteStats:
+    route: str
+    requests: int
+    errors: int
+    throughput: float
+    p50_ms: float | None
+    p95_ms: float | None
+    p99_ms: float | None
+    status_codes: dict[str, int]
+
+
+@dataclass
+class LoadTestResult:
+    workers: int
+    threads: int
+    clients: int
+    duration: float
+    requests: int
+    errors: int
+    throughput: float
+    p50_ms: float | None
+    p95_ms: float | None
+    p99_ms: float | None
+    routes: list[RouteStats]
+    worker_rss_mb: dict[str, dict[str, float]]
+    server_log: str
+
+
+def _percentiles(latencies: list[float]) -> tuple[float | None, float | None, float | None]:
+    if not latencies:
+        return None, None, None
+    p50, p95, p99 = np.percentile(np.asarray(latencies) * 1000, [50, 95, 99])
+    return float(p50), float(p95), float(p99)
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _child_pids(parent: int) -> list[int]:
+    pids = []
+    for stat in Path("/proc").glob("[0-9]*/stat"):
+        try:
+            # The command name may contain spaces, so split after its closing paren.
+            fields = stat.read_text().rsplit(")", 1)[1].split()
+        except (OSError, IndexError):
+            continue
+        if int(fields[1]) == parent:
+            pids.append(int(stat.parent.name))
+    return pids
+
+
+def _rss_mb(pid: int) -> float | None:
+    try:
+        for line in Path(f"/proc/{pid}/status").read_text().splitlines():
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1]) / 1024
+    except OSError:
+        return None
+    return None
+
+
+class _MemorySampler(threading.Thread):
+    """Polls the resident memory of each gunicorn worker via ``/proc``."""
+
+    def __init__(self, master_pid: int, interval: float):
+        super().__init__(daemon=True)
+        self.master_pid = master_pid
+        self.interval = interval
+        self.samples: dict[int, list[float]] = {}
+        self._stop_event = threading.Event()
+
+    def run(self) -> None:
+        while not self._stop_event.wait(self.interval):
+            for pid in _child_pids(self.master_pid):
+                rss = _rss_mb(pid)
+                if rss is not None:
+                    self.samples.setdefault(pid, []).append(rss)
+
+    def stop(self) -> dict[str, dict[str, float]]:
+        self._stop_event.set()
+        self.join()
+        return {
+            str(pid): {"mean": float(np.mean(values)), "peak": float(np.max(values))}
+            for pid, values in self.samples.items()
+        }
+
+
+def _prepare_environment(root: Path) -> dict[str, str]:
+    """Point the app at a scratch directory with replayed data and a trained model."""
+    env = {
+        **os.environ,
+        "TRADING_DATA_DIR": str(root / "data"),
+        "TRADING_ARTIFACTS_DIR": str(root / "artifacts"),
+        "TRADING_DATA_SOURCE": "replay",
+    }
+    env.pop("TRADING_RUN_DB", None)
+    # run_store_path defaults to TRADING_RUN_DB; override it so the scratch run stays in ``root``.
+    app_cfg = AppConfig(
+        data_dir=root / "data",
+        artifacts_dir=root / "artifacts",
+        data_source="replay",
+        run_store_path=str(root / "artifacts" / "runs.sqlite3"),
+    )
+    app_cfg.ensure_directories()
+    DayTradingPipeline(app_cfg).train()
+    return env
+
+
+def _start_server(
+    env: dict[str, str], workers: int, threads: int, port: int, timeout: float, log_path: Path
+) -> subprocess.Popen:
+    # gunicorn keeps its own copy of the descriptor, so ours can be closed right away.
+    with log_path.open("ab") as log:
+        proc = subprocess.Popen(
+            [
+                sys.executable,
+                "-m",
+                "gunicorn",
+                "trading_models.app:app",
+                "--workers",
+                str(workers),
+                "--threads",
+                str(threads),
+                "--bind",
+                f"127.0.0.1:{port}",
+                "--timeout",
+                "300",
+                "--chdir",
+                str(Path(__file__).resolve().parents[1]),
+            ],
+            env=env,
+            stdout=log,
+            stderr=subprocess.STDOUT,
+        )
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if proc.poll() is not None:
+            raise RuntimeError(f"gunicorn exited with code {proc.returncode} during startup; see {log_path}")
+        try:
+            requests.get(f"http://127.0.0.1:{port}/", timeout=1)
+            return proc
+        except requests.RequestException:
+            time.sleep(0.2)
+    _stop_server(proc)
+    raise RuntimeError(f"gunicorn did not accept connections within {timeout:.0f}s; see {log_path}")
+
+
+def _stop_server(proc: subprocess.Popen) -> None:
+    proc.terminate()
+    try:
+        proc.wait(timeout=30)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.wait()
+
+
+def _client(base_url: str, cfg: LoadTestConfig, client_id: int, deadline: float) -> list[tuple[str, float, str]]:
+    rng = random.Random(cfg.seed + client_id)
+    routes = list(cfg.routes)
+    weights = [cfg.routes[route] for route in routes]
+    records = []
+    with requests.Session() as session:
+        while time.monotonic() < deadline:
+            route = rng.choices(routes, weights)[0]
+            start = time.perf_counter()
+            try:
+                if route in POST_ROUTES:
+                    response = session.post(
+                        base_url + route, json={"epochs": cfg.train_epochs}, timeout=cfg.request_timeout
+                    )
+                else:
+                    response = session.get(base_url + route, timeout=cfg.request_timeout)
+                status = str(response.status_code)
+            except requests.RequestException as exc:
+                status = type(exc).__name__
+            records.append((route, time.perf_counter() - start, status))
+    return records
+
+
+def _drive(base_url: str, cfg: LoadTestConfig) -> tuple[list[tuple[str, float, str]], float]:
+    start = time.monotonic()
+    deadline = start + cfg.duration
+    with ThreadPoolExecutor(max_workers=cfg.clients) as pool:
+        futures = [pool.submit(_client, base_url, cfg, client_id, deadline) for client_id in range(cfg.clients)]
+        records = [record for future in futures for record in future.result()]
+    return records, time.monotonic() - start
+
+
+def _is_error(status: str) -> bool:
+    """Client exceptions are recorded by name; anything not a 2xx/3xx code counts as an error."""
+    return not (status.isdigit() and int(status) < 400)
+
+
+def _summarise(
+    records: list[tuple[str, float, str]],
+    elapsed: float,
+    workers: int,
+    threads: int,
+    cfg: LoadTestConfig,
+    memory: dict[str, dict[str, float]],
+    server_log: Path,
+) -> LoadTestResult:
+    route_stats = []
+    for route in cfg.routes:
+        latencies = [latency for name, latency, _ in records if name == route]
+        statuses = [status for name, _, status in records if name == route]
+        route_stats.append(
+            RouteStats(
+                route,
+                len(latencies),
+                sum(1 for status in statuses if _is_error(status)),
+                len(latencies) / elapsed,
+                *_percentiles(latencies),
+                status_codes={status: statuses.count(status) for status in sorted(set(statuses))},
+            )
+        )
+    p50, p95, p99 = _percentiles([latency for _, latency, _ in records])
+    return LoadTestResult(
+        workers=workers,
+        threads=threads,
+        clients=cfg.clients,
+        duration=elapsed,
+        requests=len(records),
+        errors=sum(1 for _, _, status in records if _is_error(status)),
+        throughput=len(records) / elapsed,
+        p50_ms=p50,
+        p95_ms=p95,
+        p99_ms=p99,
+        routes=route_stats,
+        worker_rss_mb=memory,
+        server_log=str(server_log),
+    )
+
+
+def run_load_test(cfg: LoadTestConfig) -> list[LoadTestResult]:
+    """Benchmark every ``workers x threads`` combination against replayed data.
+
+    A model is trained once in a scratch directory, then for each combination
+    a fresh gunicorn server is started and ``cfg.clients`` concurrent clients
+    hit the weighted route mix for ``cfg.duration`` seconds. Each server's
+    stdout/stderr goes to ``cfg.log_dir`` (a fresh temp directory by default,
+    kept after the run) so failed requests can be traced to their tracebacks.
+    """
+    results = []
+    log_dir = Path(cfg.log_dir or tempfile.mkdtemp(prefix="trading-loadtest-logs-"))
+    log_dir.mkdir(parents=True, exist_ok=True)
+    with tempfile.TemporaryDirectory(prefix="trading-loadtest-") as tmp:
+        env = _prepare_environment(Path(tmp))
+        for workers in cfg.workers:
+            for threads in cfg.threads:
+                port = _free_port()
+                log_path = log_dir / f"gunicorn-w{workers}-t{threads}.log"
+                proc = _start_server(env, workers, threads, port, cfg.startup_timeout, log_path)
+                sampler = _MemorySampler(proc.pid, cfg.sample_interval)
+                sampler.start()
+                try:
+                    records, elapsed = _drive(f"http://127.0.0.1:{port}", cfg)
+                finally:
+                    memory = sampler.stop()
+                    _stop_server(proc)
+                results.append(_summarise(records, elapsed, workers, threads, cfg, memory, log_path))
+    return results
+
+
+def _fmt_ms(value: float | None) -> str:
+    return "-" if value is None else f"{value:.1f}"
+
+
+def format_report(results: list[LoadTestResult]) -> str:
+    lines = []
+    for result in results:
+        peak_rss = [stats["peak"] for stats in result.worker_rss_mb.values()]
+        memory = f"{max(peak_rss):.0f} MB peak/worker" if peak_rss else "memory n/a"
+        lines.append(
+            f"workers={result.workers} threads={result.threads} clients={result.clients}: "
+            f"{result.throughput:.1f} req/s, {result.errors}/{result.requests} errors, "
+            f"p50/p95/p99 {_fmt_ms(result.p50_ms)}/{_fmt_ms(result.p95_ms)}/{_fmt_ms(result.p99_ms)} ms, {memory}"
+        )
+        for route in result.routes:
+            lines.append(
+                f"  {route.route:<22} {route.requests:>6} req {route.throughput:>8.1f} req/s {route.errors:>5} err "
+                f"p50 {_fmt_ms(route.p50_ms):>8} p95 {_fmt_ms(route.p95_ms):>8} p99 {_fmt_ms(route.p99_ms):>8} ms "
+                f"[{', '.join(f'{status}: {count}' for status, count in route.status_codes.items())}]"
+            )
+        lines.append(f"  server log: {result.server_log}")
+    return "\n".join(lines)
@@ -0,0 +1,164 @@
+"""Probability calibration and decision threshold search for the day trading model."""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+from sklearn.isotonic import IsotonicRegression
+from sklearn.linear_model import LogisticRegression
+
+
+CALIBRATION_METHODS = ("isotonic", "platt", "none")
+THRESHOLD_METRICS = ("f1", "accuracy", "precision", "recall", "pnl")
+
+
+@dataclass
+class ThresholdSweep:
+    """Scores for every distinct decision threshold, highest threshold first.
+
+    ``thresholds[i]`` selects the rows with ``probability > thresholds[i]``;
+    the first entry selects nothing and the last selects every row.
+    """
+
+    thresholds: np.ndarray
+    selected: np.ndarray
+    scores: dict[str, np.ndarray]
+
+    def best(self, metric: str, allow_select_all: bool = False) -> tuple[float, float]:
+        """Threshold with the highest ``metric`` score.
+
+        The last cut (every row signalled long) is skipped unless
+        ``allow_select_all`` is set: on a weak classifier recall-driven
+        metrics such as F1 otherwise settle on "always long".
+        """
+        if metric not in self.scores:
+            raise ValueError(f"Unknown threshold metric '{metric}'. Choose from {sorted(self.scores)}")
+        scores = self.scores[metric]
+        if not allow_select_all and len(scores) > 1:
+            scores = scores[:-1]
+        idx = int(np.argmax(scores))
+        return float(self.thresholds[idx]), float(self.scores[metric][idx])
+
+
+def sweep_thresholds(probs: np.ndarray, y: np.ndarray, returns: np.ndarray | None = None) -> ThresholdSweep:
+    """Evaluate all thresholds at once from a single descending sort.
+
+    Sorting by probability turns "predict long above ``t``" into "take the top
+    ``k`` rows", so true positives and PnL for every ``k`` are cumulative sums.
+    Rows sharing a probability are only split at block boundaries. Thresholds
+    sit halfway between neighbouring distinct probabilities. PnL is the sum of
+    ``returns`` over the rows signalled long.
+    """
+    probs = np.asarray(probs, dtype=float)
+    y = np.asarray(y, dtype=float)
+    order = np.argsort(-probs, kind="mergesort")
+    sorted_probs = probs[order]
+    n = len(sorted_probs)
+    positives = y.sum()
+
+    if n:
+        ends = np.flatnonzero(np.r_[sorted_probs[1:] != sorted_probs[:-1], True])
+        block_probs = sorted_probs[ends]
+        cuts = np.r_[(block_probs[:-1] + block_probs[1:]) / 2, np.nextafter(block_probs[-1], -np.inf)]
+    else:
+        ends = np.array([], dtype=int)
+        cuts = np.array([])
+    thresholds = np.r_[1.0, cuts]
+
+    selected = np.r_[0, ends + 1].astype(float)
+    tp = np.r_[0.0, np.cumsum(y[order])[ends]]
+    fp = selected - tp
+    with np.errstate(divide="ignore", invalid="ignore"):
+        precision = np.where(selected > 0, tp / selected, 0.0)
+        recall = tp / positives if positives else np.zeros_like(tp)
+        f1 = np.where(selected + positives > 0, 2 * tp / (selected + positives), 0.0)
+    accuracy = (tp + (n - positives - fp)) / n if n else np.zeros_like(tp)
+    scores = {
+        "f1": f1,
+        "accuracy": accuracy,
+        "precision": precision,
+        "recall": recall,
+    }
+    if returns is not None:
+        sorted_returns = np.nan_to_num(np.asarray(returns, dtype=float)[order])
+        scores["pnl"] = np.r_[0.0, np.cumsum(sorted_returns)[ends]]
+    return ThresholdSweep(thresholds=thresholds, selected=selected, scores=scores)
+
+
+@dataclass
+class ProbabilityCalibrator:
+    """Maps raw model probabilities to calibrated ones and holds the tuned threshold.
+
+    The default instance is the identity mapping with a ``0.5`` threshold,
+    which reproduces the behaviour of an uncalibrated model.
+    """
+
+    method: str = "none"
+    estimator: Any = None
+    threshold: float = 0.5
+    metric: str | None = None
+    score: float | None = None
+
+    def transform(self, probs: np.ndarray) -> np.ndarray:
+        probs = np.asarray(probs, dtype=float)
+        if self.method == "isotonic":
+            return self.estimator.predict(probs)
+        if self.method == "platt":
+            return self.estimator.predict_proba(_logit(probs).reshape(-1, 1))[:, 1]
+        return probs
+
+    def signals(self, calibrated: np.ndarray) -> np.ndarray:
+        return (np.asarray(calibrated) > self.threshold).astype(int)
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            "method": self.method,
+            "threshold": self.threshold,
+            "metric": self.metric,
+            "score": self.score,
+        }
+
+
+def _logit(probs: np.ndarray) -> np.ndarray:
+    clipped = np.clip(probs, 1e-6, 1 - 1e-6)
+    return np.log(clipped / (1 - clipped))
+
+
+def fit_calibrator(probs: np.ndarray, y: np.ndarray, method: str = "isotonic") -> ProbabilityCalibrator:
+    if method not in CALIBRATION_METHODS:
+        raise ValueError(f"Unknown calibration method '{method}'. Choose from {CALIBRATION_METHODS}")
+    y = np.asarray(y).astype(int)
+    # Both calibrators need examples of each class; fall back to the identity.
+    if method == "none" or len(np.unique(y)) < 2:
+        return ProbabilityCalibrator()
+    if method == "isotonic":
+        estimator = IsotonicRegression(y_min=0.0, y_max=1.0, out_of_bounds="clip").fit(probs, y)
+    else:
+        estimator = LogisticRegression().fit(_logit(np.asarray(probs, dtype=float)).reshape(-1, 1), y)
+    return ProbabilityCalibrator(method=method, estimator=estimator)
+
+
+def calibrate(
+    probs: np.ndarray,
+    y: np.ndarray,
+    returns: np.ndarray | None = None,
+    method: str = "isotonic",
+    metric: str = "pnl",
+    allow_select_all: bool = False,
+) -> tuple[ProbabilityCalibrator, np.ndarray]:
+    """Fit a calibrator on validation scores and tune its decision threshold.
+
+    Returns the calibrator and the calibrated validation probabilities.
+    """
+    if metric not in THRESHOLD_METRICS:
+        raise ValueError(f"Unknown threshold metric '{metric}'. Choose from {THRESHOLD_METRICS}")
+    if metric == "pnl" and returns is None:
+        raise ValueError("Threshold metric 'pnl' requires validation returns")
+    calibrator = fit_calibrator(probs, y, method)
+    calibrated = calibrator.transform(probs)
+    if len(calibrated):
+        sweep = sweep_thresholds(calibrated, y, returns)
+        calibrator.threshold, calibrator.score = sweep.best(metric, allow_select_all=allow_select_all)
+    calibrator.metric = metric
+    return calibrator, calibrated
@@ -15,6 +15,8 @@ class DayTradingConfig:
     validation_size: float = 0.2
     epochs: int = 12
     threshold: float = 0.0005
+    calibration_method: str = "isotonic"
+    threshold_metric: str = "pnl"
     random_state: int = 42
     model_filename: str = "day_trading_sgd.joblib"
     metrics_filename: str = "metrics.json"
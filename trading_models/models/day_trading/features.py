@@ -1,55 +1,86 @@
 """Feature engineering helpers for the day trading model."""
 from __future__ import annotations
 
+from typing import Mapping
+
 import numpy as np
 import pandas as pd
 
+from ...kernels import compute_window_features, rsi
 from .config import DayTradingConfig
 
 
+NON_FEATURE_COLUMNS = {
+    "timestamp",
+    "Open",
+    "High",
+    "Low",
+    "Close",
+    "Adj Close",
+    "Volume",
+    "target",
+    "target_return",
+}
+
+
 def compute_rsi(close: pd.Series, window: int) -> pd.Series:
-    delta = close.diff()
-    gain = delta.clip(lower=0)
-    loss = -delta.clip(upper=0)
-    avg_gain = gain.ewm(alpha=1 / window, adjust=False).mean()
-    avg_loss = loss.ewm(alpha=1 / window, adjust=False).mean()
-    rs = avg_gain / (avg_loss + 1e-9)
-    return 100 - (100 / (1 + rs))
-
-
-def engineer_features(df: pd.DataFrame, cfg: DayTradingConfig) -> pd.DataFrame:
-    data = df.copy()
-    data["return"] = data["Close"].pct_change()
-    data["log_return"] = np.log1p(data["return"])
-    data["price_change"] = data["Close"].diff()
-
-    for window in cfg.feature_windows:
-        data[f"sma_{window}"] = data["Close"].rolling(window).mean()
-        data[f"ema_{window}"] = data["Close"].ewm(span=window, adjust=False).mean()
-        data[f"momentum_{window}"] = data["Close"].pct_change(window)
-        data[f"volatility_{window}"] = data["return"].rolling(window).std()
-        data[f"volume_sma_{window}"] = data["Volume"].rolling(window).mean()
-
-    data["rsi"] = compute_rsi(data["Close"], cfg.rsi_window)
+    return pd.Series(rsi(close.to_numpy(dtype=float), window), index=close.index, name=close.name)
+
+
+def _finalise_features(
+    df: pd.DataFrame,
+    columns: Mapping[str, np.ndarray],
+    cfg: DayTradingConfig,
+) -> tuple[pd.DataFrame, list[str]]:
+    data = df.assign(**columns)
     data["target_return"] = data["Close"].pct_change().shift(-1)
     data["target"] = (data["target_return"] > cfg.threshold).astype(int)
 
     data.dropna(inplace=True)
-    feature_cols = [
-        col
-        for col in data.columns
-        if col
-        not in {
-            "timestamp",
-            "Open",
-            "High",
-            "Low",
-            "Close",
-            "Adj Close",
-            "Volume",
-            "target",
-            "target_return",
-        }
-    ]
+    feature_cols = [col for col in data.columns if col not in NON_FEATURE_COLUMNS]
     data = data[["timestamp", "Close", "Volume", *feature_cols, "target", "target_return"]]
     return data, feature_cols
+
+
+def engineer_features(df: pd.DataFrame, cfg: DayTradingConfig) -> tuple[pd.DataFrame, list[str]]:
+    columns = compute_window_features(
+        df["Close"].to_numpy(dtype=float),
+        df["Volume"].to_numpy(dtype=float),
+        cfg.feature_windows,
+        cfg.rsi_window,
+        n_jobs=1,
+    )
+    return _finalise_features(df, columns, cfg)
+
+
+def engineer_universe_features(
+    frames: Mapping[str, pd.DataFrame],
+    cfg: DayTradingConfig,
+    n_jobs: int | None = None,
+) -> dict[str, tuple[pd.DataFrame, list[str]]]:
+    """Engineer features for many symbols with a single kernel call.
+
+    Each symbol's bars are left-aligned into a ``(symbols, time)`` matrix and
+    right-padded with ``NaN``; the kernels only look backwards, so padding
+    never leaks into real rows. Results match :func:`engineer_features` per
+    symbol.
+    """
+    if not frames:
+        return {}
+    symbols = list(frames)
+    lengths = [len(frames[symbol]) for symbol in symbols]
+    close = np.full((len(symbols), max(lengths)), np.nan)
+    volume = np.full_like(close, np.nan)
+    for row, symbol in enumerate(symbols):
+        close[row, : lengths[row]] = frames[symbol]["Close"].to_numpy(dtype=float)
+        volume[row, : lengths[row]] = frames[symbol]["Volume"].to_numpy(dtype=float)
+
+    columns = compute_window_features(close, volume, cfg.feature_windows, cfg.rsi_window, n_jobs=n_jobs)
+    return {
+        symbol: _finalise_features(
+            frames[symbol],
+            {key: values[row, : lengths[row]] for key, values in columns.items()},
+            cfg,
+        )
+        for row, symbol in enumerate(symbols)
+    }
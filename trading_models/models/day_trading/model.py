@@ -1,6 +1,8 @@
 """Model definition for the day trading strategy."""
 from __future__ import annotations
 
+import os
+import tempfile
 from pathlib import Path
 from typing import Any
 
@@ -18,6 +20,7 @@ from sklearn.metrics import (
 )
 from sklearn.preprocessing import StandardScaler
 
+from .calibration import ProbabilityCalibrator, calibrate
 from .config import DayTradingConfig
 
 
@@ -28,6 +31,7 @@ class DayTradingModel:
         self.storage_dir.mkdir(parents=True, exist_ok=True)
         self.scaler = StandardScaler()
         self.model = self._create_model()
+        self.calibrator = ProbabilityCalibrator()
         self.classes_ = np.array([0, 1])
 
     # Training loop
@@ -36,6 +40,7 @@ class DayTradingModel:
         history: list[dict[str, Any]] = []
         self.model = self._create_model()
         self.scaler = StandardScaler()
+        self.calibrator = ProbabilityCalibrator()
         X_train_scaled = self.scaler.fit_transform(X_train)
         X_val_scaled = self.scaler.transform(X_val)
         # Initial call to establish classes
@@ -48,8 +53,12 @@ class DayTradingModel:
         return history
 
     def _evaluate_scaled(self, X_scaled: np.ndarray, y: np.ndarray) -> dict[str, float]:
-        preds = self.model.predict(X_scaled)
-        proba = self.model.predict_proba(X_scaled)[:, 1]
+        return self.evaluate_proba(self.model.predict_proba(X_scaled)[:, 1], y)
+
+    def evaluate_proba(self, proba: np.ndarray, y: np.ndarray, threshold: float = 0.5) -> dict[str, float]:
+        """Score cached positive-class probabilities without re-running the model."""
+        # For a log-loss SGDClassifier ``predict`` is exactly ``proba > 0.5``.
+        preds = (proba > threshold).astype(int)
         metrics = {
             "accuracy": float(accuracy_score(y, preds)),
             "precision": float(precision_score(y, preds, zero_division=0)),
@@ -84,15 +93,47 @@ class DayTradingModel:
     def predict_proba(self, X: np.ndarray) -> np.ndarray:
         return self.model.predict_proba(self.scaler.transform(X))
 
+    def calibrate(self, proba: np.ndarray, y: np.ndarray, returns: np.ndarray | None = None) -> np.ndarray:
+        """Fit the calibrator and decision threshold on cached validation probabilities.
+
+        Returns the calibrated probabilities for ``proba``.
+        """
+        self.calibrator, calibrated = calibrate(
+            proba,
+            y,
+            returns=returns,
+            method=self.cfg.calibration_method,
+            metric=self.cfg.threshold_metric,
+        )
+        return calibrated
+
+    def predict_signals(self, X: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Return calibrated long probabilities and the thresholded signals."""
+        probs = self.calibrator.transform(self.predict_proba(X)[:, 1])
+        return probs, self.calibrator.signals(probs)
+
     def save(self) -> None:
         path = self.storage_dir / self.cfg.model_filename
-        joblib.dump({"model": self.model, "scaler": self.scaler, "config": self.cfg}, path)
+        # Dump next to the target and swap it in atomically so concurrent
+        # ``load`` calls (e.g. the stream endpoint) never read a partial file.
+        fd, tmp_name = tempfile.mkstemp(dir=self.storage_dir, prefix=f".{path.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as fp:
+                joblib.dump(
+                    {"model": self.model, "scaler": self.scaler, "calibrator": self.calibrator, "config": self.cfg},
+                    fp,
+                )
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
 
     def load(self) -> None:
         path = self.storage_dir / self.cfg.model_filename
         bundle = joblib.load(path)
         self.model = bundle["model"]
         self.scaler = bundle["scaler"]
+        self.calibrator = bundle.get("calibrator") or ProbabilityCalibrator()
         saved_cfg = bundle.get("config")
         if saved_cfg:
             self.cfg = saved_cfg
@@ -8,63 +8,109 @@ import numpy as np
 import pandas as pd
 
 from ...config import AppConfig
-from ...utils import load_json, save_json
+from ...store import RunStore
+from ...utils import load_json
 from .config import DayTradingConfig
-from .data import describe_data, load_or_download
+from .data import describe_data, fingerprint_data, load_or_download
 from .features import engineer_features
 from .model import DayTradingModel
 
 
 class DayTradingPipeline:
+    model_name = "day_trading"
+
     def __init__(self, app_cfg: AppConfig, model_cfg: DayTradingConfig | None = None):
         self.app_cfg = app_cfg
         self.model_cfg = model_cfg or DayTradingConfig(symbol=app_cfg.default_symbol)
         self.storage_dir = app_cfg.day_trading_storage
+        self.store = RunStore(app_cfg.run_store)
         self.model = DayTradingModel(self.model_cfg, storage_dir=self.storage_dir)
 
     def load_data(self, force_download: bool = False) -> pd.DataFrame:
         return load_or_download(self.app_cfg, self.model_cfg, force=force_download)
 
-    def prepare_datasets(self, df: pd.DataFrame) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, list[str]]:
+    def _split_features(self, df: pd.DataFrame) -> tuple[pd.DataFrame, list[str], int]:
         features_df, feature_cols = engineer_features(df, self.model_cfg)
-        X = features_df[feature_cols].values
-        y = features_df["target"].values.astype(int)
         split_idx = int(len(features_df) * (1 - self.model_cfg.validation_size))
         split_idx = max(1, min(len(features_df) - 1, split_idx))
-        X_train, X_val = X[:split_idx], X[split_idx:]
-        y_train, y_val = y[:split_idx], y[split_idx:]
-        return X_train, X_val, y_train, y_val, feature_cols
+        return features_df, feature_cols, split_idx
+
+    @staticmethod
+    def _split_arrays(
+        features_df: pd.DataFrame, feature_cols: list[str], split_idx: int
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        X = features_df[feature_cols].values
+        y = features_df["target"].values.astype(int)
+        return X[:split_idx], X[split_idx:], y[:split_idx], y[split_idx:]
+
+    def prepare_datasets(self, df: pd.DataFrame) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, list[str]]:
+        features_df, feature_cols, split_idx = self._split_features(df)
+        return (*self._split_arrays(features_df, feature_cols, split_idx), feature_cols)
 
     def train(self, force_download: bool = False) -> dict[str, Any]:
         df = self.load_data(force_download=force_download)
-        X_train, X_val, y_train, y_val, feature_cols = self.prepare_datasets(df)
+        features_df, feature_cols, split_idx = self._split_features(df)
+        X_train, X_val, y_train, y_val = self._split_arrays(features_df, feature_cols, split_idx)
+        val_returns = features_df["target_return"].values[split_idx:]
         history = self.model.fit(X_train, y_train, X_val, y_val)
-        evaluation = self.model.evaluate(X_val, y_val)
-        pred_val = self.model.predict(X_val)
-        final_report = self.model.inference_metrics(y_val, pred_val)
+        # Score the validation set once and reuse it for evaluation and calibration.
+        val_proba = self.model.predict_proba(X_val)[:, 1]
+        evaluation = self.model.evaluate_proba(val_proba, y_val)
+        calibrated = self.model.calibrate(val_proba, y_val, returns=val_returns)
+        calibrator = self.model.calibrator
+        # The calibrator and threshold were fitted on these same rows, so this
+        # score is in-sample and not comparable with ``evaluation``.
+        calibration = {
+            **calibrator.summary(),
+            "fit_evaluation": self.model.evaluate_proba(calibrated, y_val, threshold=calibrator.threshold),
+        }
+        final_report = self.model.inference_metrics(y_val, calibrator.signals(calibrated))
         metadata = {
             "config": self.model_cfg.__dict__,
             "data": describe_data(df),
             "features": feature_cols,
         }
         self.model.save()
-        save_json(self.storage_dir / self.model_cfg.metrics_filename, {
-            "evaluation": evaluation,
-            "metadata": metadata,
-            "history": history,
-        })
-        save_json(self.storage_dir / self.model_cfg.history_filename, history)
+        run_id = self.store.record_run(
+            self.model_name,
+            config=self.model_cfg.__dict__,
+            evaluation=evaluation,
+            history=history,
+            calibration=calibration,
+            metadata=metadata,
+            data_fingerprint=fingerprint_data(df),
+        )
         return {
+            "run_id": run_id,
             "evaluation": evaluation,
+            "calibration": calibration,
             "history": history,
             "metadata": metadata,
             "report": final_report,
         }
 
+    def latest_run_id(self) -> int | None:
+        return self.store.latest_run_id(self.model_name)
+
     def load_metrics(self) -> dict[str, Any] | None:
-        return load_json(self.storage_dir / self.model_cfg.metrics_filename)
+        run = self.store.latest_run(self.model_name)
+        if run is None:
+            # Artefacts trained before the run store existed.
+            return load_json(self.storage_dir / self.model_cfg.metrics_filename)
+        return {
+            "run_id": run["id"],
+            "created_at": run["created_at"],
+            "data_fingerprint": run["data_fingerprint"],
+            "evaluation": run["evaluation"],
+            "calibration": run["calibration"],
+            "metadata": run["metadata"],
+            "history": self.store.run_history(run["id"]),
+        }
 
     def load_history(self) -> list[dict[str, Any]] | None:
+        run_id = self.latest_run_id()
+        if run_id is not None:
+            return self.store.run_history(run_id)
         data = load_json(self.storage_dir / self.model_cfg.history_filename)
         if not data:
             return []
@@ -7,6 +7,7 @@ from datetime import datetime
 import pandas as pd
 
 from ...config import AppConfig
+from ...store import utc_timestamp
 from .config import DayTradingConfig
 from .data import load_or_download
 from .features import engineer_features
@@ -27,6 +28,7 @@ class DayTradingStreamer:
         self.app_cfg = pipeline.app_cfg
         self.cfg = pipeline.model_cfg
         self.pipeline.model.load()
+        self.run_id = pipeline.latest_run_id()
 
     def latest_points(self) -> pd.DataFrame:
         raw = load_or_download(self.app_cfg, self.cfg, force=True)
@@ -34,9 +36,8 @@ class DayTradingStreamer:
         if features_df.empty:
             return pd.DataFrame(columns=["timestamp", "price", "probability", "signal"])
         X = features_df[feature_cols].values
-        probs = self.pipeline.model.predict_proba(X)[:, 1]
-        signals = (probs > 0.5).astype(int)
-        return pd.DataFrame(
+        probs, signals = self.pipeline.model.predict_signals(X)
+        points = pd.DataFrame(
             {
                 "timestamp": features_df["timestamp"].values,
                 "price": features_df["Close"].values,
@@ -44,6 +45,24 @@ class DayTradingStreamer:
                 "signal": signals,
             }
         ).tail(self.cfg.max_stream_points)
+        self.log_points(points)
+        return points
+
+    def log_points(self, points: pd.DataFrame) -> None:
+        """Record bars newer than the last logged one, one batched write per poll."""
+        store = self.pipeline.store
+        points = points.assign(timestamp=points["timestamp"].map(utc_timestamp))
+        latest = store.latest_signal_timestamp(self.pipeline.model_name, self.cfg.symbol)
+        if latest is not None:
+            points = points[points["timestamp"] > latest]
+        if points.empty:
+            return
+        store.log_signals(
+            self.pipeline.model_name,
+            self.cfg.symbol,
+            points[["timestamp", "price", "probability", "signal"]].itertuples(index=False, name=None),
+            run_id=self.run_id,
+        )
 
     def to_stream_points(self) -> list[StreamPoint]:
         df = self.latest_points()
@@ -7,6 +7,7 @@ from pathlib import Path
 from flask import Blueprint, Response, current_app, jsonify, render_template, request
 
 from ...config import AppConfig
+from ...store import utc_timestamp
 from .config import DayTradingConfig
 from .pipeline import DayTradingPipeline
 from .realtime import DayTradingStreamer
@@ -26,6 +27,12 @@ def _app_config() -> AppConfig:
     return current_app.config["APP_CONFIG"]
 
 
+def _pagination(default_per_page: int = 20, max_per_page: int = 500) -> tuple[int, int]:
+    page = max(1, request.args.get("page", 1, type=int))
+    per_page = min(max_per_page, max(1, request.args.get("per_page", default_per_page, type=int)))
+    return page, per_page
+
+
 @day_trading_bp.route("/")
 def dashboard() -> str:
     pipeline = DayTradingPipeline(_app_config())
@@ -72,6 +79,72 @@ def status_endpoint() -> Response:
     )
 
 
+@day_trading_bp.get("/runs")
+def runs_endpoint() -> Response:
+    pipeline = DayTradingPipeline(_app_config())
+    page, per_page = _pagination()
+    return jsonify(
+        {
+            "page": page,
+            "per_page": per_page,
+            "total": pipeline.store.count_runs(pipeline.model_name),
+            "runs": pipeline.store.list_runs(pipeline.model_name, limit=per_page, offset=(page - 1) * per_page),
+        }
+    )
+
+
+@day_trading_bp.get("/runs/<int:run_id>")
+def run_detail_endpoint(run_id: int) -> Response:
+    pipeline = DayTradingPipeline(_app_config())
+    run = pipeline.store.get_run(run_id)
+    if run is None or run["model"] != pipeline.model_name:
+        return jsonify({"status": "not_found"}), 404
+    history = pipeline.store.run_history(run_id)
+    return jsonify({**run, "history": history, "history_plot": history_to_plot(history)})
+
+
+@day_trading_bp.get("/runs/compare")
+def compare_runs_endpoint() -> Response:
+    pipeline = DayTradingPipeline(_app_config())
+    try:
+        run_ids = [int(value) for value in request.args.get("ids", "").split(",") if value.strip()]
+    except ValueError:
+        return jsonify({"status": "error", "message": "ids must be a comma separated list of run ids"}), 400
+    return jsonify(pipeline.store.compare_runs(run_ids))
+
+
+@day_trading_bp.get("/signals")
+def signals_endpoint() -> Response:
+    pipeline = DayTradingPipeline(_app_config())
+    symbol = request.args.get("symbol", pipeline.model_cfg.symbol)
+    page, per_page = _pagination(default_per_page=pipeline.model_cfg.max_stream_points)
+    try:
+        start, end = (
+            utc_timestamp(value) if value else None
+            for value in (request.args.get("start"), request.args.get("end"))
+        )
+    except ValueError:
+        return jsonify({"status": "error", "message": "start and end must be ISO 8601 timestamps"}), 400
+    return jsonify(
+        {
+            "symbol": symbol,
+            "start": start,
+            "end": end,
+            "page": page,
+            "per_page": per_page,
+            "total": pipeline.store.count_signals(pipeline.model_name, symbol, start=start, end=end),
+            "signals": pipeline.store.query_signals(
+                pipeline.model_name,
+                symbol,
+                start=start,
+                end=end,
+                limit=per_page,
+                offset=(page - 1) * per_page,
+            ),
+        }
+    )
+
+
 @day_trading_bp.get("/stream")
 def stream_endpoint() -> Response:
     pipeline = DayTradingPipeline(_app_config())
@@ -0,0 +1,264 @@
+"""SQLite-backed history of training runs, epoch metrics and live signals."""
+from __future__ import annotations
+
+import json
+import sqlite3
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Mapping
+
+import pandas as pd
+
+from .utils import ensure_parent
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    model TEXT NOT NULL,
+    symbol TEXT,
+    created_at TEXT NOT NULL,
+    data_fingerprint TEXT,
+    config TEXT,
+    evaluation TEXT,
+    calibration TEXT,
+    metadata TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_runs_model ON runs (model, id DESC);
+CREATE INDEX IF NOT EXISTS idx_runs_fingerprint ON runs (data_fingerprint);
+
+CREATE TABLE IF NOT EXISTS epochs (
+    run_id INTEGER NOT NULL REFERENCES runs (id) ON DELETE CASCADE,
+    epoch INTEGER NOT NULL,
+    metrics TEXT NOT NULL,
+    PRIMARY KEY (run_id, epoch)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS signals (
+    model TEXT NOT NULL,
+    symbol TEXT NOT NULL,
+    timestamp TEXT NOT NULL,
+    price REAL,
+    probability REAL,
+    signal INTEGER,
+    run_id INTEGER,
+    PRIMARY KEY (model, symbol, timestamp)
+) WITHOUT ROWID;
+"""
+
+_JSON_COLUMNS = ("config", "evaluation", "calibration", "metadata")
+
+
+def utc_timestamp(value: Any) -> str:
+    """Normalise a timestamp to the ``YYYY-MM-DDTHH:MM:SSZ`` form stored in ``signals``.
+
+    Naive values are taken to be UTC; offset-aware values are converted. The
+    fixed-width format keeps string comparison equivalent to time ordering.
+    """
+    ts = pd.Timestamp(value)
+    ts = ts.tz_localize("UTC") if ts.tzinfo is None else ts.tz_convert("UTC")
+    return ts.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _dumps(payload: Any) -> str:
+    return json.dumps(payload, sort_keys=True, default=str)
+
+
+def _run_from_row(row: sqlite3.Row) -> dict[str, Any]:
+    run = dict(row)
+    for column in _JSON_COLUMNS:
+        if column in run and run[column] is not None:
+            run[column] = json.loads(run[column])
+    return run
+
+
+class RunStore:
+    """Embedded store for every training run and the signals served from it.
+
+    Each call opens a short-lived connection so the store is safe to share
+    between Flask worker threads. The database runs in WAL mode, so dashboard
+    reads never block signal writes. The schema is (re)created whenever a
+    connection finds the file missing, so removing or rotating ``artifacts/``
+    under a running app starts a fresh history instead of failing.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        fresh = not self.path.exists()
+        if fresh:
+            ensure_parent(self.path)
+        conn = sqlite3.connect(self.path, timeout=30)
+        conn.row_factory = sqlite3.Row
+        if fresh:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(SCHEMA)
+        conn.execute("PRAGMA foreign_keys=ON")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    # Training runs
+    def record_run(
+        self,
+        model: str,
+        config: Mapping[str, Any],
+        evaluation: Mapping[str, Any],
+        history: list[Mapping[str, Any]],
+        calibration: Mapping[str, Any] | None = None,
+        metadata: Mapping[str, Any] | None = None,
+        data_fingerprint: str | None = None,
+    ) -> int:
+        """Persist a run and its per-epoch history in a single transaction."""
+        with self._connect() as conn:
+            cursor = conn.execute(
+                "INSERT INTO runs (model, symbol, created_at, data_fingerprint, config, evaluation, calibration, metadata)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    model,
+                    config.get("symbol"),
+                    datetime.now(timezone.utc).isoformat(),
+                    data_fingerprint,
+                    _dumps(config),
+                    _dumps(evaluation),
+                    _dumps(calibration) if calibration is not None else None,
+                    _dumps(metadata) if metadata is not None else None,
+                ),
+            )
+            run_id = int(cursor.lastrowid)
+            conn.executemany(
+                "INSERT INTO epochs (run_id, epoch, metrics) VALUES (?, ?, ?)",
+                ((run_id, int(entry["epoch"]), _dumps(entry)) for entry in history),
+            )
+        return run_id
+
+    def get_run(self, run_id: int) -> dict[str, Any] | None:
+        with self._connect() as conn:
+            row = conn.execute("SELECT * FROM runs WHERE id = ?", (run_id,)).fetchone()
+        return _run_from_row(row) if row else None
+
+    def latest_run(self, model: str) -> dict[str, Any] | None:
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT * FROM runs WHERE model = ? ORDER BY id DESC LIMIT 1", (model,)
+            ).fetchone()
+        return _run_from_row(row) if row else None
+
+    def latest_run_id(self, model: str) -> int | None:
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT id FROM runs WHERE model = ? ORDER BY id DESC LIMIT 1", (model,)
+            ).fetchone()
+        return row["id"] if row else None
+
+    def list_runs(self, model: str, limit: int = 20, offset: int = 0) -> list[dict[str, Any]]:
+        """Newest-first page of runs without the bulky ``metadata`` column."""
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT id, model, symbol, created_at, data_fingerprint, config, evaluation, calibration"
+                " FROM runs WHERE model = ? ORDER BY id DESC LIMIT ? OFFSET ?",
+                (model, limit, offset),
+            ).fetchall()
+        return [_run_from_row(row) for row in rows]
+
+    def count_runs(self, model: str) -> int:
+        with self._connect() as conn:
+            return conn.execute("SELECT COUNT(*) FROM runs WHERE model = ?", (model,)).fetchone()[0]
+
+    def run_history(self, run_id: int) -> list[dict[str, Any]]:
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT metrics FROM epochs WHERE run_id = ? ORDER BY epoch", (run_id,)
+            ).fetchall()
+        return [json.loads(row["metrics"]) for row in rows]
+
+    def compare_runs(self, run_ids: Iterable[int]) -> dict[str, Any]:
+        """Line up evaluation metrics of several runs, keyed by metric name."""
+        run_ids = [int(run_id) for run_id in run_ids]
+        if not run_ids:
+            return {"runs": [], "metrics": {}}
+        placeholders = ", ".join("?" for _ in run_ids)
+        with self._connect() as conn:
+            rows = conn.execute(
+                f"SELECT id, symbol, created_at, data_fingerprint, evaluation, calibration FROM runs WHERE id IN ({placeholders})",
+                run_ids,
+            ).fetchall()
+        found = {row["id"]: _run_from_row(row) for row in rows}
+        runs = [found[run_id] for run_id in run_ids if run_id in found]
+        metric_names = sorted({key for run in runs for key in (run["evaluation"] or {})})
+        metrics = {name: [(run["evaluation"] or {}).get(name) for run in runs] for name in metric_names}
+        return {"runs": runs, "metrics": metrics}
+
+    # Live signals
+    def log_signals(
+        self,
+        model: str,
+        symbol: str,
+        rows: Iterable[tuple[Any, float, float, int]],
+        run_id: int | None = None,
+    ) -> None:
+        """Insert ``(timestamp, price, probability, signal)`` rows in one transaction.
+
+        Rows are keyed by ``(model, symbol, timestamp)`` and existing bars are
+        left untouched, so the log keeps what was first served for each bar
+        even after a retrain.
+        """
+        with self._connect() as conn:
+            conn.executemany(
+                "INSERT OR IGNORE INTO signals (model, symbol, timestamp, price, probability, signal, run_id)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    (model, symbol, utc_timestamp(timestamp), float(price), float(probability), int(signal), run_id)
+                    for timestamp, price, probability, signal in rows
+                ),
+            )
+
+    @staticmethod
+    def _signal_filter(
+        model: str, symbol: str, start: str | None, end: str | None
+    ) -> tuple[str, list[Any]]:
+        clauses = ["model = ?", "symbol = ?"]
+        params: list[Any] = [model, symbol]
+        if start is not None:
+            clauses.append("timestamp >= ?")
+            params.append(utc_timestamp(start))
+        if end is not None:
+            clauses.append("timestamp <= ?")
+            params.append(utc_timestamp(end))
+        return " AND ".join(clauses), params
+
+    def query_signals(
+        self,
+        model: str,
+        symbol: str,
+        start: str | None = None,
+        end: str | None = None,
+        limit: int = 500,
+        offset: int = 0,
+    ) -> list[dict[str, Any]]:
+        """Newest-first page of logged signals, optionally bounded by timestamp."""
+        where, params = self._signal_filter(model, symbol, start, end)
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT timestamp, price, probability, signal, run_id FROM signals"
+                f" WHERE {where} ORDER BY timestamp DESC LIMIT ? OFFSET ?",
+                (*params, limit, offset),
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def count_signals(self, model: str, symbol: str, start: str | None = None, end: str | None = None) -> int:
+        where, params = self._signal_filter(model, symbol, start, end)
+        with self._connect() as conn:
+            return conn.execute(f"SELECT COUNT(*) FROM signals WHERE {where}", params).fetchone()[0]
+
+    def latest_signal_timestamp(self, model: str, symbol: str) -> str | None:
+        with self._connect() as conn:
+            return conn.execute(
+                "SELECT MAX(timestamp) FROM signals WHERE model = ? AND symbol = ?", (model, symbol)
+            ).fetchone()[0]
@@ -6,6 +6,8 @@ from dataclasses import asdict, is_dataclass
 from pathlib import Path
 from typing import Any
 
+from .kernels import rolling_window  # noqa: F401 - re-exported for backwards compatibility
+
 
 def ensure_parent(path: Path) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
@@ -27,8 +29,3 @@ def load_json(path: Path) -> Any:
     with path.open("r", encoding="utf-8") as fp:
         return json.load(fp)
 
-
-def rolling_window(series, window: int):
-    """Simple rolling window generator."""
-    for idx in range(window - 1, len(series)):
-        yield series[idx - window + 1 : idx + 1]